@@ -1,16 +1,100 @@
 import argparse
-import json
+import bisect
+import functools
+import hashlib
 import math
 import pathlib
 import string
-from typing import Dict, List, Optional, Tuple
+import sys
+from typing import Annotated, Callable, Container, Dict, Iterable, Optional, Tuple
+
+try:  # Optional: faster JSON parsing
+    import orjson as _json
+except ImportError:  # pragma: no cover - optional dependency
+    import json as _json
+
+try:  # Optional: typed policy validation in C
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+try:  # Optional: Bloom filter support for large breach corpora
+    import rbloom
+except ImportError:  # pragma: no cover - optional dependency
+    rbloom = None
+
+
+# Character-class bits reported by _char_classes().
+_LOWER_BIT = 1
+_UPPER_BIT = 2
+_DIGIT_BIT = 4
+_SYMBOL_BIT = 8
+_SPACE_BIT = 16
+_NON_ASCII_BIT = 32
+
+_ASCII = frozenset(map(chr, range(128)))
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_ASCII_DIGITS = frozenset(string.digits)
+# str.isspace() also accepts the ASCII separators missing from string.whitespace
+_ASCII_SPACE = frozenset(c for c in _ASCII if c.isspace())
+_PUNCT = frozenset(string.punctuation)
+_PUNCT_LEN = len(string.punctuation)
+_WS_LEN = len(string.whitespace)
+
+# Pool size for every combination of class bits, built once at import.
+_POOL_FOR_FLAGS = tuple(
+    sum(
+        size
+        for bit, size in (
+            (_LOWER_BIT, 26),
+            (_UPPER_BIT, 26),
+            (_DIGIT_BIT, 10),
+            (_SYMBOL_BIT, _PUNCT_LEN),
+            (_SPACE_BIT, _WS_LEN),
+            (_NON_ASCII_BIT, 100),
+        )
+        if flags & bit
+    )
+    for flags in range(64)
+)
 
-from textual.app import App, ComposeResult
-from textual.widgets import Button, Input, Select, Static
-from textual.containers import Horizontal
 
+def _char_classes(password: str) -> int:
+    """Return a bitmask of the character classes present in the password.
 
-def compute_entropy(password: str) -> Tuple[int, int, float, str]:
+    The password is reduced to its unique characters once, and the ASCII
+    classes are tested with set operations. Only non-ASCII characters fall
+    back to the str predicates so Unicode behaviour is unchanged.
+    """
+    chars = set(password)
+    flags = 0
+    if not chars.isdisjoint(_ASCII_LOWER):
+        flags |= _LOWER_BIT
+    if not chars.isdisjoint(_ASCII_UPPER):
+        flags |= _UPPER_BIT
+    if not chars.isdisjoint(_ASCII_DIGITS):
+        flags |= _DIGIT_BIT
+    if not chars.isdisjoint(_PUNCT):
+        flags |= _SYMBOL_BIT
+    if not chars.isdisjoint(_ASCII_SPACE):
+        flags |= _SPACE_BIT
+    if not password.isascii():
+        flags |= _NON_ASCII_BIT
+        for c in chars - _ASCII:
+            if c.islower():
+                flags |= _LOWER_BIT
+            if c.isupper():
+                flags |= _UPPER_BIT
+            if c.isdigit():
+                flags |= _DIGIT_BIT
+            if c.isspace():
+                flags |= _SPACE_BIT
+    return flags
+
+
+@functools.lru_cache(maxsize=512)
+def compute_entropy(password: str) -> Tuple[int, int, float, str, int]:
     """Compute password entropy using a simple pool-based model.
 
     The character pool is estimated from character classes present:
@@ -25,107 +109,195 @@ def compute_entropy(password: str) -> Tuple[int, int, float, str]:
     - Weak: length < 8 or entropy < 40
     - Moderate: entropy < 60
     - Strong: otherwise
+
+    The class bitmask from _char_classes() is returned last so policy checks
+    can reuse it instead of scanning the password again.
+
+    Results are memoized, since live typing re-evaluates the same prefixes
+    whenever the user backspaces or retypes.
     """
-    pool = 0
-    if any(c.islower() for c in password):
-        pool += 26
-    if any(c.isupper() for c in password):
-        pool += 26
-    if any(c.isdigit() for c in password):
-        pool += 10
-    if any(c in string.punctuation for c in password):
-        pool += len(string.punctuation)
-    if any(c.isspace() for c in password):
-        pool += len(string.whitespace)
-    if any(ord(c) > 127 for c in password):
-        pool += 100
+    classes = _char_classes(password)
+    pool = _POOL_FOR_FLAGS[classes]
 
     length = len(password)
     entropy = 0.0 if pool == 0 or length == 0 else length * math.log2(pool)
     rating = (
         "Weak" if length < 8 or entropy < 40 else ("Moderate" if entropy < 60 else "Strong")
     )
-    return length, pool, entropy, rating
+    return length, pool, entropy, rating, classes
+
+
+if msgspec is not None:
+
+    class PolicyCfg(msgspec.Struct):
+        """Schema of one framework in frameworks.json; unknown keys are ignored."""
+
+        min_length: Annotated[int, msgspec.Meta(ge=0)] = 0
+        require_lower: bool = False
+        require_upper: bool = False
+        require_digits: bool = False
+        require_symbols: bool = False
+        min_entropy: Annotated[float, msgspec.Meta(ge=0)] = 0.0
+        desc: str = ""
+
+    def _convert_policies(frameworks: Dict) -> Dict[str, Dict]:
+        """Validate frameworks against PolicyCfg, skipping entries that don't match."""
+        policies: Dict[str, Dict] = {}
+        for name, cfg in frameworks.items():
+            try:
+                policies[name] = msgspec.structs.asdict(msgspec.convert(cfg, PolicyCfg))
+            except msgspec.ValidationError:
+                continue
+        return policies
+
+
+@functools.lru_cache(maxsize=1)
+def _load_frameworks_raw():
+    """Read and parse frameworks.json once; errors propagate and are not cached."""
+    path = pathlib.Path(__file__).with_name("frameworks.json")
+    return _json.loads(path.read_bytes())
+
+
+# Breach lists larger than this are kept as a sorted tuple instead of a set.
+_BREACH_SET_MAX = 100_000
+
+
+class _SortedBreachList(tuple):
+    """Sorted, de-duplicated passwords with O(log n) bisect membership.
+
+    Uses a fraction of a frozenset's memory, for breach lists with millions
+    of entries.
+    """
+
+    def __contains__(self, password: object) -> bool:
+        i = bisect.bisect_left(self, password)
+        return i < len(self) and self[i] == password
+
+
+def _bloom_hash(obj: str) -> int:
+    """Stable 128-bit hash so saved Bloom filters survive interpreter restarts."""
+    digest = hashlib.sha256(obj.encode("utf-8")).digest()
+    return int.from_bytes(digest[:16], "big", signed=True)
+
+
+def save_breach_bloom(
+    passwords: Iterable[str], path: Optional[pathlib.Path] = None, false_positive_rate: float = 0.001
+) -> pathlib.Path:
+    """Build a Bloom filter from passwords (lowercased) and save it as breach.bloom.
+
+    The filter needs about 1.44 * log2(1 / false_positive_rate) bits per
+    entry, roughly 1.8 bytes at the default 0.1%. Requires the optional
+    ``rbloom`` package. Returns the path written.
+    """
+    if rbloom is None:
+        raise RuntimeError("rbloom is required to build a breach Bloom filter")
+    words = [str(x).lower() for x in passwords]
+    bloom = rbloom.Bloom(max(len(words), 1), false_positive_rate, _bloom_hash)
+    bloom.update(words)
+    path = path or pathlib.Path(__file__).with_name("breach.bloom")
+    bloom.save(str(path))
+    return path
+
+
+def is_probabilistic_breach_list(breach_list: Container[str]) -> bool:
+    """True if hits may be false positives, i.e. the list is a Bloom filter."""
+    return rbloom is not None and isinstance(breach_list, rbloom.Bloom)
 
 
-def load_breach_list() -> List[str]:
+@functools.lru_cache(maxsize=1)
+def load_breach_list() -> Container[str]:
     """Load list of common breached passwords (lowercased) from JSON.
 
-    Returns a list of lowercased passwords. On error, returns an empty list.
+    Returns a frozenset of lowercased passwords for O(1) membership checks,
+    or a sorted tuple searched with bisect once the list exceeds
+    _BREACH_SET_MAX entries. If breach_top_250.json is absent but
+    breach.bloom exists and ``rbloom`` is installed, the Bloom filter is
+    loaded instead (about 1.8 bytes per entry at the default 0.1%
+    false-positive rate; see is_probabilistic_breach_list). On error,
+    returns an empty frozenset. The result is loaded once and cached.
     """
     path = pathlib.Path(__file__).with_name("breach_top_250.json")
+    bloom_path = path.with_name("breach.bloom")
     try:
-        data = json.loads(path.read_text())
+        if not path.exists() and bloom_path.exists() and rbloom is not None:
+            return rbloom.Bloom.load(str(bloom_path), _bloom_hash)
+        data = _json.loads(path.read_bytes())
         if isinstance(data, list):
-            return [str(x).lower() for x in data]
+            words = frozenset(str(x).lower() for x in data)
+            if len(words) > _BREACH_SET_MAX:
+                return _SortedBreachList(sorted(words))
+            return words
     except Exception:
         pass
-    return []
-
-
-class PassStrength(App):
-    CSS = """
-    Screen { align: left top; padding: 0 0 0 4; }
-    #title { dock: top; content-align: left middle; height: 4; color: magenta; margin: 1 0; text-style: bold; }
-    #policy_row { width: 72; height: 3; }
-    #policy_label { width: 26; content-align: left middle; color: $accent; text-style: bold; }
-    #policy { width: 46; }
-    #policy_heading { width: 72; content-align: left middle; color: $accent; text-style: bold; }
-    #policy_box { width: 72; border: round $accent; padding: 1 2; margin: 0 0 1 0; }
-    #pw { width: 72; margin: 1 0; }
-    #check { width: 16; margin: 1 0; text-style: bold; }
-    #results_heading { width: 72; content-align: left middle; color: $accent; text-style: bold; }
-    #results { width: 72; border: round $accent; padding: 1 2; margin: 0 0 1 0; }
+    return frozenset()
+
+
+def _compile_policy_checker(policy: Dict) -> Callable[[int, float, int], Dict[str, bool]]:
+    """Return a requirement checker with the policy's settings bound in.
+
+    Built once per policy change, so each keystroke skips the dict lookups.
     """
+    min_length = policy.get("min_length", 0)
+    req_lower = bool(policy.get("require_lower"))
+    req_upper = bool(policy.get("require_upper"))
+    req_digits = bool(policy.get("require_digits"))
+    req_symbols = bool(policy.get("require_symbols"))
+    min_entropy = float(policy.get("min_entropy", 0))
+
+    def check(classes: int, entropy: float, length: int) -> Dict[str, bool]:
+        return {
+            "min_length": length >= min_length,
+            "lower": (not req_lower) or bool(classes & _LOWER_BIT),
+            "upper": (not req_upper) or bool(classes & _UPPER_BIT),
+            "digit": (not req_digits) or bool(classes & _DIGIT_BIT),
+            "symbol": (not req_symbols) or bool(classes & _SYMBOL_BIT),
+            "entropy": (not min_entropy) or entropy >= min_entropy,
+        }
+
+    return check
 
-    policies: Dict[str, Dict]
-    current: Optional[str]
-    breach_list: List[str]
-    load_error: Optional[str]
-
-    def load_policies(self) -> None:
-        """Load and validate policy frameworks from JSON with graceful fallback."""
-        self.load_error = None
-        path = pathlib.Path(__file__).with_name("frameworks.json")
-        try:
-            raw = json.loads(path.read_text())
-        except Exception as exc:
-            self.load_error = f"Failed to read frameworks.json: {exc}"
-            raw = {}
-
-        frameworks = raw.get("frameworks") if isinstance(raw, dict) else None
-        if not isinstance(frameworks, dict):
-            frameworks = {}
 
+def _load_policies_data() -> Tuple[Dict[str, Dict], Optional[str], Optional[str]]:
+    """Load and validate policy frameworks from JSON with graceful fallback.
+
+    Returns (policies, default policy name, load error). Kept free of the
+    Textual App so the CLI can use it without importing Textual.
+    """
+    load_error = None
+    try:
+        raw = _load_frameworks_raw()
+    except Exception as exc:
+        load_error = f"Failed to read frameworks.json: {exc}"
+        raw = {}
+
+    frameworks = raw.get("frameworks") if isinstance(raw, dict) else None
+    if not isinstance(frameworks, dict):
+        frameworks = {}
+
+    if msgspec is not None:
+        policies = _convert_policies(frameworks)
+    else:
+        # Same rules as PolicyCfg: exact JSON types, no coercion
         def valid_bool(v):
             return isinstance(v, bool)
 
         def valid_int(v):
-            return isinstance(v, int) and v >= 0
+            return isinstance(v, int) and not isinstance(v, bool) and v >= 0
 
         def valid_number(v):
-            return (isinstance(v, (int, float))) and v >= 0
+            return isinstance(v, (int, float)) and not isinstance(v, bool) and v >= 0
 
-        policies: Dict[str, Dict] = {}
+        policies = {}
         for name, cfg in frameworks.items():
             if not isinstance(cfg, dict):
                 continue
             min_length = cfg.get("min_length", 0)
             min_entropy = cfg.get("min_entropy", 0)
-            if not valid_int(min_length) or not valid_number(min_entropy):
+            desc = cfg.get("desc", "")
+            if not valid_int(min_length) or not valid_number(min_entropy) or not isinstance(desc, str):
                 continue
-            policy = {
-                "min_length": int(min_length),
-                "require_lower": bool(cfg.get("require_lower", False)),
-                "require_upper": bool(cfg.get("require_upper", False)),
-                "require_digits": bool(cfg.get("require_digits", False)),
-                "require_symbols": bool(cfg.get("require_symbols", False)),
-                "min_entropy": float(min_entropy),
-                "desc": str(cfg.get("desc", "")),
-            }
-            # Ensure booleans are booleans
             if not all(
-                valid_bool(policy[k])
+                valid_bool(cfg.get(k, False))
                 for k in [
                     "require_lower",
                     "require_upper",
@@ -134,149 +306,24 @@ class PassStrength(App):
                 ]
             ):
                 continue
-            policies[name] = policy
-
-        if not policies:
-            # Fallback minimal policy
-            policies = {"Simple": {"min_length": 6, "desc": "Simple: 6+"}}
-            self.load_error = self.load_error or "No valid policies found; using fallback."
-
-        self.policies = policies
-        default = raw.get("default") if isinstance(raw, dict) else None
-        self.current = default if default in self.policies else next(iter(self.policies), None)
-        self.breach_list = load_breach_list()
-
-    def policy_text(self, name: str) -> str:
-        """Return a human-readable description of the selected policy."""
-        p = self.policies.get(name, {})
-        if not p:
-            return "No policy selected."
-        reqs = [
-            f"min_length>={p.get('min_length', 0)}",
-            *(label for key, label in [
-                ("require_lower", "lower"),
-                ("require_upper", "upper"),
-                ("require_digits", "digit"),
-                ("require_symbols", "symbol"),
-            ] if p.get(key)),
-        ]
-        if p.get("min_entropy"):
-            reqs.append(f"min_entropy>={int(p['min_entropy'])}")
-        desc = p.get("desc", "").strip()
-        lead = f"{name}: {desc}" if desc else name
-        return lead + ("\n" + ", ".join(reqs) if reqs else "")
-
-    def _policy_check(self, password: str, entropy: float, length: int) -> Dict[str, bool]:
-        """Evaluate policy requirement satisfaction for the current policy."""
-        p = self.policies.get(self.current or "", {})
-        return {
-            "min_length": length >= p.get("min_length", 0),
-            "lower": (not p.get("require_lower")) or any(c.islower() for c in password),
-            "upper": (not p.get("require_upper")) or any(c.isupper() for c in password),
-            "digit": (not p.get("require_digits")) or any(c.isdigit() for c in password),
-            "symbol": (not p.get("require_symbols")) or any(c in string.punctuation for c in password),
-            "entropy": (not p.get("min_entropy")) or entropy >= float(p.get("min_entropy", 0)),
-        }
+            policies[name] = {
+                "min_length": min_length,
+                "require_lower": cfg.get("require_lower", False),
+                "require_upper": cfg.get("require_upper", False),
+                "require_digits": cfg.get("require_digits", False),
+                "require_symbols": cfg.get("require_symbols", False),
+                "min_entropy": float(min_entropy),
+                "desc": desc,
+            }
 
-    def _update_results(self, password: str) -> None:
-        """Compute and update the results panel for the given password."""
-        length, pool, entropy, rating = compute_entropy(password)
-        color = "red" if rating == "Weak" else ("yellow3" if rating == "Moderate" else "green")
-
-        # Breach list check (case-insensitive)
-        breach_line = "Breach List: [green]Not found[/]"
-        if password and self.breach_list and password.lower() in self.breach_list:
-            breach_line = "Breach List: [red](!) Found in top breaches[/]"
-
-        # Policy compliance summary with per-requirement breakdown
-        checks = self._policy_check(password, entropy, length)
-        failed = [k for k, v in checks.items() if not v]
-        p_title = f"Policy ({self.current}): " if self.current else "Policy: "
-        policy_line = (
-            f"{p_title}[green]Passed[/]" if not failed else f"{p_title}[red]Failed[/] ({', '.join(failed)})"
-        )
-        # Pretty per-requirement indicators
-        labels = [
-            ("min_length", f"min_length>={self.policies.get(self.current or '', {}).get('min_length', 0)}"),
-            ("lower", "lower"),
-            ("upper", "upper"),
-            ("digit", "digit"),
-            ("symbol", "symbol"),
-            ("entropy", f"entropy>={int(self.policies.get(self.current or '', {}).get('min_entropy', 0))}"),
-        ]
-        parts = []
-        for key, label in labels:
-            ok = checks.get(key, True)
-            mark = "[green]✓[/]" if ok else "[red]✗[/]"
-            parts.append(f"{mark} {label}")
-        breakdown = ", ".join(parts)
-
-        txt = (
-            f"Length: {length}\n"
-            f"Character pool: {pool}\n"
-            f"Entropy: {entropy:.2f} bits\n"
-            f"Rating: [bold {color}]{rating}[/]\n"
-            f"{breach_line}\n"
-            f"{policy_line}\n"
-            f"Requirements: {breakdown}"
-        )
-        self.query_one("#results", Static).update(txt)
-
-    def compose(self) -> ComposeResult:
-        title_text = "PassStrength"
-        border = "-" * (len(title_text) + 4)
-        boxed_title = f"{border}\n| {title_text} |\n{border}"
-        yield Static(boxed_title, id="title")
-        yield Horizontal(
-            Static("Framework / Requirement:", id="policy_label"),
-            Select(options=[], id="policy"),
-            id="policy_row",
-        )
-        yield Static("Policy", id="policy_heading")
-        yield Static("", id="policy_box")
-        yield Input(placeholder="Enter password", password=True, id="pw")
-        yield Button("Check", id="check")
-        yield Static("Results", id="results_heading")
-        yield Static("", id="results")
-
-    def on_mount(self) -> None:
-        self.load_policies()
-        sel = self.query_one("#policy", Select)
-        sel.set_options([(n, n) for n in self.policies.keys()])
-        if self.current:
-            sel.value = self.current
-            sel.disabled = False
-        else:
-            sel.disabled = True
-        self.query_one("#policy_box", Static).update(self.policy_text(sel.value))
-        if self.load_error:
-            self.query_one("#results", Static).update(f"[red]{self.load_error}[/]")
-        # Prime breach list line even with empty password
-        self._update_results("")
-
-    def on_select_changed(self, event: Select.Changed) -> None:
-        if event.select.id == "policy":
-            self.current = event.value
-            self.query_one("#policy_box", Static).update(self.policy_text(self.current))
-            # Re-evaluate current input against new policy
-            pw = self.query_one("#pw", Input).value
-            self._update_results(pw)
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id != "check":
-            return
-        pw = self.query_one("#pw", Input).value
-        self._update_results(pw)
-
-    def on_input_submitted(self, event: Input.Submitted) -> None:
-        """Trigger check when pressing Enter in the password input."""
-        if event.input.id == "pw":
-            self._update_results(event.value)
-
-    def on_input_changed(self, event: Input.Changed) -> None:
-        """Live updates as the user types in the password field."""
-        if event.input.id == "pw":
-            self._update_results(event.value)
+    if not policies:
+        # Fallback minimal policy
+        policies = {"Simple": {"min_length": 6, "desc": "Simple: 6+"}}
+        load_error = load_error or "No valid policies found; using fallback."
+
+    default = raw.get("default") if isinstance(raw, dict) else None
+    current = default if default in policies else next(iter(policies), None)
+    return policies, current, load_error
 
 
 def _run_cli() -> None:
@@ -286,34 +333,45 @@ def _run_cli() -> None:
     parser.add_argument("--password", "-w", help="Password to evaluate (careful: visible in history)")
     args = parser.parse_args()
 
-    app = PassStrength()
-    # Load data without starting the event loop
-    app.load_policies()
-    if args.policy and args.policy in app.policies:
-        app.current = args.policy
+    policies, current, _ = _load_policies_data()
+    if args.policy and args.policy in policies:
+        current = args.policy
+    check = _compile_policy_checker(policies.get(current or "", {}))
 
     pw = args.password or ""
-    length, pool, entropy, rating = compute_entropy(pw)
-    checks = app._policy_check(pw, entropy, length)
-    failed = [k for k, v in checks.items() if not v]
-    breach_hit = pw and app.breach_list and pw.lower() in app.breach_list
-
-    print(f"Policy: {app.current}")
+    length, pool, entropy, rating, classes = compute_entropy(pw)
+    checks = check(classes, entropy, length)
+    failed = [] if all(checks.values()) else [k for k, v in checks.items() if not v]
+    pw_lower = pw.lower()
+    breach_list = load_breach_list()
+    breach_hit = bool(pw_lower) and pw_lower in breach_list
+    found = "LIKELY FOUND" if is_probabilistic_breach_list(breach_list) else "FOUND"
+
+    print(f"Policy: {current}")
     print(f"Length: {length}")
     print(f"Pool: {pool}")
     print(f"Entropy: {entropy:.2f} bits")
     print(f"Rating: {rating}")
-    print(f"Breach List: {'FOUND' if breach_hit else 'not found'}")
+    print(f"Breach List: {found if breach_hit else 'not found'}")
     print("Failed: " + (", ".join(failed) if failed else "(none)"))
 
 
-if __name__ == "__main__":
-    # Run CLI if explicitly requested via env/args: we choose arg presence
-    import sys
+def _run_tui() -> None:
+    """Launch the Textual TUI; Textual is only imported on this path."""
+    from pass_strength_tui import PassStrength
+
+    PassStrength().run()
+
 
+def main() -> None:
+    """Run the CLI when --cli / cli is given, otherwise the TUI."""
     if any(arg in ("--cli", "cli") for arg in sys.argv):
         # Remove the flag and run CLI
         sys.argv = [a for a in sys.argv if a not in ("--cli", "cli")]
         _run_cli()
     else:
-        PassStrength().run()
+        _run_tui()
+
+
+if __name__ == "__main__":
+    main()
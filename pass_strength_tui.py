@@ -0,0 +1,237 @@
+"""Textual TUI for PassStrength; the scoring logic lives in pass_strength."""
+
+from typing import Callable, Container, Dict, Optional
+
+from textual.app import App, ComposeResult
+from textual.widgets import Button, Input, Select, Static
+from textual.containers import Horizontal, Vertical
+from textual.timer import Timer
+
+from pass_strength import (
+    _compile_policy_checker,
+    _load_policies_data,
+    compute_entropy,
+    is_probabilistic_breach_list,
+    load_breach_list,
+)
+
+# Policy requirement keys, in the order they are shown in the results panel.
+_CHECK_KEYS = ("min_length", "lower", "upper", "digit", "symbol", "entropy")
+_MARK_OK = "[green]✓[/]"
+_MARK_FAIL = "[red]✗[/]"
+
+
+class PassStrength(App):
+    CSS = """
+    Screen { align: left top; padding: 0 0 0 4; }
+    #title { dock: top; content-align: left middle; height: 4; color: magenta; margin: 1 0; text-style: bold; }
+    #policy_row { width: 72; height: 3; }
+    #policy_label { width: 26; content-align: left middle; color: $accent; text-style: bold; }
+    #policy { width: 46; }
+    #policy_heading { width: 72; content-align: left middle; color: $accent; text-style: bold; }
+    #policy_box { width: 72; border: round $accent; padding: 1 2; margin: 0 0 1 0; }
+    #pw { width: 72; margin: 1 0; }
+    #check { width: 16; margin: 1 0; text-style: bold; }
+    #results_heading { width: 72; content-align: left middle; color: $accent; text-style: bold; }
+    #results { width: 72; height: auto; border: round $accent; padding: 1 2; margin: 0 0 1 0; }
+    """
+
+    policies: Dict[str, Dict]
+    current: Optional[str]
+    breach_list: Container[str]
+    _breach_found_line: str
+    load_error: Optional[str]
+    _policy_text_cache: Dict[str, str]
+    _breakdown_tpl: str
+    _check_fn: Callable[[int, float, int], Dict[str, bool]]
+    _result_lines: Dict[str, str]
+    _result_widgets: Dict[str, Static]
+    _policy_box_widget: Static
+    _pw_widget: Input
+    _pending_update_timer: Optional[Timer] = None
+
+    # Delay before live typing re-evaluates, so bursts of keys coalesce
+    UPDATE_DEBOUNCE = 0.08
+
+    def load_policies(self) -> None:
+        """Load and validate policy frameworks from JSON with graceful fallback."""
+        self.policies, current, self.load_error = _load_policies_data()
+        self.breach_list = load_breach_list()
+        self._breach_found_line = (
+            "Breach List: [red](!) Likely found in top breaches[/]"
+            if is_probabilistic_breach_list(self.breach_list)
+            else "Breach List: [red](!) Found in top breaches[/]"
+        )
+        self._policy_text_cache = {name: self._build_policy_text(name) for name in self.policies}
+        self._select_policy(current)
+
+    def _select_policy(self, name: Optional[str]) -> None:
+        """Make name the current policy and rebuild everything derived from it."""
+        self.current = name
+        self._breakdown_tpl = self._build_breakdown_template()
+        self._check_fn = _compile_policy_checker(self.policies.get(self.current or "", {}))
+
+    def policy_text(self, name: str) -> str:
+        """Return a human-readable description of the selected policy."""
+        return self._policy_text_cache.get(name, "No policy selected.")
+
+    def _build_policy_text(self, name: str) -> str:
+        """Format the description of a policy; cached per name by load_policies."""
+        p = self.policies.get(name, {})
+        if not p:
+            return "No policy selected."
+        reqs = [
+            f"min_length>={p.get('min_length', 0)}",
+            *(label for key, label in [
+                ("require_lower", "lower"),
+                ("require_upper", "upper"),
+                ("require_digits", "digit"),
+                ("require_symbols", "symbol"),
+            ] if p.get(key)),
+        ]
+        if p.get("min_entropy"):
+            reqs.append(f"min_entropy>={int(p['min_entropy'])}")
+        desc = p.get("desc", "").strip()
+        lead = f"{name}: {desc}" if desc else name
+        return lead + ("\n" + ", ".join(reqs) if reqs else "")
+
+    def _build_breakdown_template(self) -> str:
+        """Requirements line for the current policy, with one slot per mark."""
+        p = self.policies.get(self.current or "", {})
+        return (
+            f"{{0}} min_length>={p.get('min_length', 0)}, {{1}} lower, {{2}} upper, "
+            f"{{3}} digit, {{4}} symbol, {{5}} entropy>={int(p.get('min_entropy', 0))}"
+        )
+
+    def _update_results(self, password: str) -> None:
+        """Compute and update the results panel for the given password."""
+        length, pool, entropy, rating, classes = compute_entropy(password)
+        color = "red" if rating == "Weak" else ("yellow3" if rating == "Moderate" else "green")
+
+        # Breach list check (case-insensitive)
+        pw_lower = password.lower() if password else ""
+        breach_line = "Breach List: [green]Not found[/]"
+        if pw_lower and pw_lower in self.breach_list:
+            breach_line = self._breach_found_line
+
+        # Policy compliance summary with per-requirement breakdown
+        checks = self._check_fn(classes, entropy, length)
+        p_title = f"Policy ({self.current}): " if self.current else "Policy: "
+        if all(checks.values()):
+            policy_line = f"{p_title}[green]Passed[/]"
+        else:
+            failed = [k for k, v in checks.items() if not v]
+            policy_line = f"{p_title}[red]Failed[/] ({', '.join(failed)})"
+        # Pretty per-requirement indicators
+        breakdown = self._breakdown_tpl.format(*[_MARK_OK if checks[k] else _MARK_FAIL for k in _CHECK_KEYS])
+
+        self._set_result_line("r_len", f"Length: {length}")
+        self._set_result_line("r_pool", f"Character pool: {pool}")
+        self._set_result_line("r_entropy", f"Entropy: {entropy:.2f} bits")
+        self._set_result_line("r_rating", f"Rating: [bold {color}]{rating}[/]")
+        self._set_result_line("r_breach", breach_line)
+        self._set_result_line("r_policy", policy_line)
+        self._set_result_line("r_reqs", f"Requirements: {breakdown}")
+
+    def _set_result_line(self, widget_id: str, text: str) -> None:
+        """Update one results line, skipping the repaint when it is unchanged."""
+        if self._result_lines.get(widget_id) == text:
+            return
+        self._result_lines[widget_id] = text
+        self._result_widgets[widget_id].update(text)
+
+    def _cancel_pending_update(self) -> None:
+        """Drop a debounced update that an immediate one is about to supersede."""
+        if self._pending_update_timer is not None:
+            self._pending_update_timer.stop()
+            self._pending_update_timer = None
+
+    def _run_pending_update(self, password: str) -> None:
+        self._pending_update_timer = None
+        self._update_results(password)
+
+    def compose(self) -> ComposeResult:
+        title_text = "PassStrength"
+        border = "-" * (len(title_text) + 4)
+        boxed_title = f"{border}\n| {title_text} |\n{border}"
+        yield Static(boxed_title, id="title")
+        yield Horizontal(
+            Static("Framework / Requirement:", id="policy_label"),
+            Select(options=[], id="policy"),
+            id="policy_row",
+        )
+        yield Static("Policy", id="policy_heading")
+        yield Static("", id="policy_box")
+        yield Input(placeholder="Enter password", password=True, id="pw")
+        yield Button("Check", id="check")
+        yield Static("Results", id="results_heading")
+        yield Vertical(
+            Static("", id="r_error"),
+            *(
+                Static("", id=widget_id)
+                for widget_id in ("r_len", "r_pool", "r_entropy", "r_rating", "r_breach", "r_policy", "r_reqs")
+            ),
+            id="results",
+        )
+
+    def on_mount(self) -> None:
+        self._result_lines = {}
+        # Look widgets up once; handlers below run on every keystroke
+        self._result_widgets = {w.id: w for w in self.query("#results Static").results(Static)}
+        self._policy_box_widget = self.query_one("#policy_box", Static)
+        self._pw_widget = self.query_one("#pw", Input)
+        sel = self.query_one("#policy", Select)
+        self.load_policies()
+        sel.set_options([(n, n) for n in self.policies.keys()])
+        if self.current:
+            sel.value = self.current
+            sel.disabled = False
+        else:
+            sel.disabled = True
+        self._policy_box_widget.update(self.policy_text(sel.value))
+        error = self._result_widgets["r_error"]
+        error.display = bool(self.load_error)
+        if self.load_error:
+            error.update(f"[red]{self.load_error}[/]")
+        # Prime breach list line even with empty password
+        self._update_results("")
+
+    def on_unmount(self) -> None:
+        # Don't keep typed passwords cached after the app exits
+        self._cancel_pending_update()
+        compute_entropy.cache_clear()
+
+    def on_select_changed(self, event: Select.Changed) -> None:
+        if event.select.id == "policy":
+            self._select_policy(event.value)
+            self._policy_box_widget.update(self.policy_text(self.current))
+            # Re-evaluate current input against new policy
+            pw = self._pw_widget.value
+            self._cancel_pending_update()
+            self._update_results(pw)
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id != "check":
+            return
+        pw = self._pw_widget.value
+        self._cancel_pending_update()
+        self._update_results(pw)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Trigger check when pressing Enter in the password input."""
+        if event.input.id == "pw":
+            self._cancel_pending_update()
+            self._update_results(event.value)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Live updates as the user types, debounced to the latest value."""
+        if event.input.id == "pw":
+            self._cancel_pending_update()
+            value = event.value
+            self._pending_update_timer = self.set_timer(
+                self.UPDATE_DEBOUNCE, lambda: self._run_pending_update(value)
+            )
+
+
+if __name__ == "__main__":
+    PassStrength().run()